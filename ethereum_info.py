@@ -1,26 +1,187 @@
-import requests
+import copy
+import inspect
 import json
 import sys
 import os
 import logging
-from typing import Optional, Dict, Any
+import random
+import threading
+import time
+from functools import wraps
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Mapping, NamedTuple, Tuple, Union
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    json_loads = json.loads
 
 # Constants
 ETHERSCAN_API_URL = "https://api.etherscan.io/api"
 REQUEST_TIMEOUT = 10
 ETHERSCAN_API_MODULE = "proxy"
+USER_AGENT = "ethereum-block-info/1.0"
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5  # seconds
+BACKOFF_MAX = 30  # seconds
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+ETHERSCAN_RATE_LIMIT = 5  # requests per second (free tier)
+LATEST_BLOCK_TTL = 12  # seconds, roughly one Ethereum slot
+FINALITY_SECONDS = 64 * 12  # two epochs; older blocks can no longer be reorged
+BLOCK_CACHE_SIZE = 1024
 
 ETHERSCAN_ACTIONS = {
     "latest_block": "eth_blockNumber",
-    "transaction_count": "eth_getBlockTransactionCountByNumber",
     "block_by_number": "eth_getBlockByNumber",
 }
 
-# Logging configuration
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s",
+# Read-only request parameter templates, built once at import
+LATEST_BLOCK_PARAMS = MappingProxyType(
+    {"module": ETHERSCAN_API_MODULE, "action": ETHERSCAN_ACTIONS["latest_block"]}
 )
+BLOCK_BY_NUMBER_PARAMS = MappingProxyType(
+    {"module": ETHERSCAN_API_MODULE, "action": ETHERSCAN_ACTIONS["block_by_number"], "boolean": "true"}
+)
+LATEST_BLOCK_WITH_TRANSACTIONS_PARAMS = MappingProxyType({**BLOCK_BY_NUMBER_PARAMS, "tag": "latest"})
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+# Shared HTTP session, created on first use by get_session(); None until then
+_session: Optional["requests.Session"] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> "requests.Session":
+    """Return the shared HTTP session, importing requests and building it on first use.
+
+    Consecutive Etherscan calls reuse its keep-alive connection pool.
+    """
+    global _session
+    with _session_lock:
+        if _session is not None:
+            return _session
+
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        class DecorrelatedJitterRetry(Retry):
+            """urllib3 Retry using "decorrelated jitter" backoff: min(cap, uniform(base, previous * 3)).
+
+            Spreads retries out under rate-limit spikes instead of clustering them on powers of two.
+            """
+
+            def __init__(self, *args: Any, previous_backoff: float = 0.0, **kwargs: Any):
+                super().__init__(*args, **kwargs)
+                self.previous_backoff = previous_backoff
+                # Drawn once per attempt so repeated get_backoff_time() calls agree
+                if self.history:
+                    upper = max(self.backoff_factor, previous_backoff * 3)
+                    self._backoff = min(BACKOFF_MAX, random.uniform(self.backoff_factor, upper))
+                else:
+                    self._backoff = 0.0
+
+            def new(self, **kw: Any) -> "DecorrelatedJitterRetry":
+                kw.setdefault("previous_backoff", self._backoff or self.backoff_factor)
+                return super().new(**kw)
+
+            def get_backoff_time(self) -> float:
+                return self._backoff
+
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=DecorrelatedJitterRetry(
+                    total=MAX_RETRIES,
+                    backoff_factor=BACKOFF_BASE,
+                    status_forcelist=RETRY_STATUS_CODES,
+                    allowed_methods=("GET",),
+                    respect_retry_after_header=True,
+                ),
+            ),
+        )
+        _session = session
+        return session
+
+
+class RateLimiter:
+    """Spaces calls at least 1 / `rate` seconds apart across all threads.
+
+    Only first attempts go through it; retries made inside the urllib3 adapter are not throttled.
+    """
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_ok = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Reserve the next send slot, sleeping only if it is still in the future."""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_ok - now
+            self._next_ok = max(now, self._next_ok) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+RATE_LIMITER = RateLimiter(ETHERSCAN_RATE_LIMIT)
+
+
+def ttl_cache(
+    seconds: Union[None, float, Callable[[Any], Optional[float]]], maxsize: int = 128
+) -> Callable:
+    """Cache successful (non-None) results of a function.
+
+    Entries expire after `seconds` (never if None); `seconds` may also be a callable that picks
+    the TTL from the result. Once `maxsize` entries are held the oldest is evicted.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        lock = threading.Lock()
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Bind to the signature so positional and keyword calls share one cache entry
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = tuple(bound.arguments.items())
+
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            result = func(*bound.args, **bound.kwargs)
+            if result is not None:
+                ttl = seconds(result) if callable(seconds) else seconds
+                expires = now + ttl if ttl is not None else float("inf")
+                with lock:
+                    cache.pop(key, None)
+                    if len(cache) >= maxsize:
+                        del cache[next(iter(cache))]
+                    cache[key] = (expires, result)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
 
 
 def get_api_key() -> str:
@@ -32,13 +193,19 @@ def get_api_key() -> str:
     return api_key
 
 
-def fetch_data_from_etherscan(params: Dict[str, str], api_key: str) -> Optional[Dict[str, Any]]:
+def fetch_data_from_etherscan(params: Mapping[str, str], api_key: str) -> Optional[Dict[str, Any]]:
     """Fetch data from the Etherscan API with error handling."""
-    params["apikey"] = api_key
+    import requests
+
+    # Merge the key per call: shared session state would leak keys between threads
+    request_params = {**params, "apikey": api_key}
     try:
-        response = requests.get(ETHERSCAN_API_URL, params=params, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
+        RATE_LIMITER.acquire()
+        response = get_session().get(ETHERSCAN_API_URL, params=request_params, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 200:
+            logging.error(f"Etherscan API returned HTTP {response.status_code}.")
+            return None
+        data = json_loads(response.content)
 
         if data.get("status") == "0":
             logging.error(f"Etherscan API error: {data.get('message', 'Unknown error')}")
@@ -54,10 +221,10 @@ def fetch_data_from_etherscan(params: Dict[str, str], api_key: str) -> Optional[
     return None
 
 
+@ttl_cache(LATEST_BLOCK_TTL)
 def get_latest_block_number(api_key: str) -> Optional[int]:
     """Retrieve the latest Ethereum block number."""
-    params = {"module": ETHERSCAN_API_MODULE, "action": ETHERSCAN_ACTIONS["latest_block"]}
-    data = fetch_data_from_etherscan(params, api_key)
+    data = fetch_data_from_etherscan(LATEST_BLOCK_PARAMS, api_key)
 
     if data and "result" in data:
         try:
@@ -67,68 +234,106 @@ def get_latest_block_number(api_key: str) -> Optional[int]:
     return None
 
 
-def get_block_transaction_count(block_number: int, api_key: str) -> Optional[int]:
-    """Retrieve the number of transactions in a specific block."""
-    params = {
-        "module": ETHERSCAN_API_MODULE,
-        "action": ETHERSCAN_ACTIONS["transaction_count"],
-        "tag": hex(block_number),
-    }
+class BlockSummary(NamedTuple):
+    """The parts of a block the helpers need, small enough to cache per block."""
+
+    transaction_count: int
+    first_transaction: Optional[Dict[str, Any]]
+    timestamp: Optional[int]
+
+
+def block_cache_ttl(summary: BlockSummary) -> Optional[float]:
+    """Keep finalized blocks indefinitely and blocks near the chain tip for one slot."""
+    if summary.timestamp is None:
+        return LATEST_BLOCK_TTL
+    age = time.time() - summary.timestamp
+    return None if age > FINALITY_SECONDS else LATEST_BLOCK_TTL
+
+
+def get_block(block_number: int, api_key: str) -> Optional[Dict[str, Any]]:
+    """Retrieve a block with its full transaction objects."""
+    params = {**BLOCK_BY_NUMBER_PARAMS, "tag": hex(block_number)}
     data = fetch_data_from_etherscan(params, api_key)
 
-    if data and "result" in data:
-        try:
-            return int(data["result"], 16)
-        except ValueError:
-            logging.error(f"Failed to parse transaction count for block {block_number}.")
+    if data and isinstance(data.get("result"), dict):
+        return data["result"]
+
+    logging.error(f"Failed to retrieve block {block_number} from Etherscan API response.")
     return None
 
 
+@ttl_cache(block_cache_ttl, maxsize=BLOCK_CACHE_SIZE)
+def get_block_summary(block_number: int, api_key: str) -> Optional[BlockSummary]:
+    """Retrieve a block's transaction count and first transaction; the full block is not kept."""
+    block = get_block(block_number, api_key)
+    if block is None:
+        return None
+
+    transactions = block.get("transactions") or []
+    try:
+        timestamp: Optional[int] = int(block["timestamp"], 16)
+    except (KeyError, TypeError, ValueError):
+        timestamp = None
+    return BlockSummary(len(transactions), transactions[0] if transactions else None, timestamp)
+
+
+def get_block_transaction_count(block_number: int, api_key: str) -> Optional[int]:
+    """Retrieve the number of transactions in a specific block."""
+    summary = get_block_summary(block_number, api_key)
+    if summary is None:
+        return None
+    return summary.transaction_count
+
+
 def get_first_transaction_in_block(block_number: int, api_key: str) -> Optional[Dict[str, Any]]:
     """Retrieve the first transaction in a specific block."""
-    params = {
-        "module": ETHERSCAN_API_MODULE,
-        "action": ETHERSCAN_ACTIONS["block_by_number"],
-        "tag": hex(block_number),
-        "boolean": "true",
-    }
-    data = fetch_data_from_etherscan(params, api_key)
-
-    if data and "result" in data:
-        transactions = data["result"].get("transactions", [])
-        if transactions:
-            return transactions[0]
+    summary = get_block_summary(block_number, api_key)
+    if summary is not None and summary.first_transaction is not None:
+        # Hand out a copy so callers cannot corrupt the cached entry
+        return copy.deepcopy(summary.first_transaction)
 
     logging.warning(f"No transactions found in block {block_number}.")
     return None
 
 
+@ttl_cache(LATEST_BLOCK_TTL)
+def get_latest_block(api_key: str) -> Optional[Dict[str, Any]]:
+    """Retrieve the latest block with its full transaction objects in a single call."""
+    data = fetch_data_from_etherscan(LATEST_BLOCK_WITH_TRANSACTIONS_PARAMS, api_key)
+
+    if data and isinstance(data.get("result"), dict):
+        return data["result"]
+
+    logging.error("Failed to retrieve the latest block from Etherscan API response.")
+    return None
+
+
 def main():
     """Main function to retrieve Ethereum block data."""
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
     try:
         api_key = get_api_key()
 
-        latest_block_number = get_latest_block_number(api_key)
-        if latest_block_number is None:
-            logging.critical("Failed to retrieve the latest block number.")
+        # A single eth_getBlockByNumber("latest") call carries the number, count and first transaction
+        latest_block = get_latest_block(api_key)
+        if latest_block is None:
+            logging.critical("Failed to retrieve the latest block.")
             sys.exit(1)
 
-        logging.info(f"Latest Block Number: {latest_block_number}")
-
-        transaction_count = get_block_transaction_count(latest_block_number, api_key)
-        if transaction_count is None:
-            logging.critical(f"Failed to retrieve transaction count for block {latest_block_number}.")
+        try:
+            latest_block_number = int(latest_block["number"], 16)
+        except (KeyError, TypeError, ValueError):
+            logging.critical("Failed to parse the latest block number.")
             sys.exit(1)
 
-        logging.info(f"Transaction Count in Block {latest_block_number}: {transaction_count}")
+        logging.info(f"Latest Block Number: {latest_block_number}")
+
+        transactions = latest_block.get("transactions") or []
+        logging.info(f"Transaction Count in Block {latest_block_number}: {len(transactions)}")
 
-        if transaction_count > 0:
-            first_transaction = get_first_transaction_in_block(latest_block_number, api_key)
-            if first_transaction:
-                logging.info("First Transaction in Block:")
-                print(json.dumps(first_transaction, indent=4))
-            else:
-                logging.info("No transactions found in the latest block.")
+        if transactions:
+            logging.info("First Transaction in Block:")
+            print(json.dumps(transactions[0], indent=4))
         else:
             logging.info("No transactions in the latest block.")
 
@@ -138,6 +343,9 @@ def main():
     except EnvironmentError as e:
         logging.critical(e)
         sys.exit(1)
+    finally:
+        if _session is not None:
+            _session.close()
 
 
 if __name__ == "__main__":